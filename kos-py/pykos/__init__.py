@@ -2,5 +2,18 @@
 
 __version__ = "0.7.3"
 
+import warnings
+
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() == "python":
+    warnings.warn(
+        "pykos is running on the pure-Python protobuf backend, which is much slower; "
+        "unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python to use upb",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
 from . import services
 from .client import KOS
+from .services import DEFAULT_CHANNEL_OPTIONS, ChannelPool, build_channel
@@ -2,12 +2,13 @@
 
 import asyncio
 import warnings
-from typing import Any
+from typing import Any, Sequence
 
 import grpc
 import grpc.aio
 import nest_asyncio
 
+from pykos.services import ChannelPool
 from pykos.services.actuator import ActuatorServiceClient
 from pykos.services.imu import IMUServiceClient
 from pykos.services.inference import InferenceServiceClient
@@ -23,15 +24,29 @@ class KOS:
     Args:
         ip (str, optional): IP address of the robot running KOS. Defaults to localhost.
         port (int, optional): Port of the robot running KOS. Defaults to 50051.
+        num_channels (int, optional): Number of channels the actuator and sim
+            clients spread their RPCs over. Defaults to 4.
+        channel_options (Sequence[tuple[str, Any]], optional): gRPC options for
+            every channel, e.g. `DEFAULT_CHANNEL_OPTIONS` for keepalive and
+            flow-control tuning. Defaults to plain channels.
 
     Attributes:
         imu (IMUServiceClient): Client for the IMU service.
     """
 
-    def __init__(self, ip: str = "localhost", port: int = 50051) -> None:
+    def __init__(
+        self,
+        ip: str = "localhost",
+        port: int = 50051,
+        num_channels: int = 4,
+        channel_options: Sequence[tuple[str, Any]] | None = None,
+    ) -> None:
         self.is_open = False
         self.ip = ip
         self.port = port
+        self.num_channels = num_channels
+        self.channel_options = channel_options
+        self._pool: ChannelPool | None = None
         self._channel: grpc.aio.Channel | None = None
         self._imu: IMUServiceClient | None = None
         self._actuator: ActuatorServiceClient | None = None
@@ -102,19 +117,24 @@ class KOS:
         # Patch asyncio to allow running async code in a synchronous context.
         nest_asyncio.apply()
 
-        self._channel = grpc.aio.insecure_channel(f"{self.ip}:{self.port}")
+        self._pool = ChannelPool(
+            f"{self.ip}:{self.port}",
+            size=self.num_channels,
+            options=self.channel_options,
+        )
+        self._channel = self._pool.channels[0]
         self._imu = IMUServiceClient(self._channel)
-        self._actuator = ActuatorServiceClient(self._channel)
+        self._actuator = ActuatorServiceClient(self._pool)
         self._led_matrix = LEDMatrixServiceClient(self._channel)
         self._sound = SoundServiceClient(self._channel)
         self._process_manager = ProcessManagerServiceClient(self._channel)
         self._inference = InferenceServiceClient(self._channel)
-        self._sim = SimServiceClient(self._channel)
+        self._sim = SimServiceClient(self._pool)
 
     async def close(self) -> None:
-        """Close the gRPC channel."""
-        if self._channel is not None:
-            await self._channel.close()
+        """Close the gRPC channels."""
+        if self._pool is not None:
+            await self._pool.close()
 
     def __enter__(self) -> "KOS":
         self.connect()
@@ -1,12 +1,18 @@
 """KOS service clients."""
 
 import asyncio
+import itertools
 from abc import ABC
 from functools import wraps
 from inspect import getmembers, iscoroutinefunction
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any, Callable, Coroutine, Iterator, Sequence, TypeVar
+
+import grpc.aio
+from google.protobuf.any_pb2 import Any as AnyPb2
+from google.protobuf.message import Message
 
 T = TypeVar("T")
+MessageT = TypeVar("MessageT", bound=Message)
 
 
 def add_sync_version(async_func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., T]:  # noqa: ANN401
@@ -25,12 +31,141 @@ def add_sync_version(async_func: Callable[..., Coroutine[Any, Any, T]]) -> Calla
     return sync_version
 
 
+def no_sync_version(async_func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., Coroutine[Any, Any, T]]:
+    """Exclude an async method from automatic `_sync` generation.
+
+    Use this for methods that keep state bound to the running event loop, since
+    every sync call runs in a fresh loop via `asyncio.run`.
+    """
+    async_func.__no_sync_version__ = True  # type: ignore[attr-defined]
+    return async_func
+
+
 class AsyncClientBase(ABC):
     """Base class for async gRPC clients that automatically adds sync versions of async methods."""
 
     def __init__(self) -> None:
         for name, method in getmembers(self.__class__, iscoroutinefunction):
-            if name.startswith("__"):
+            if name.startswith("__") or getattr(method, "__no_sync_version__", False):
                 continue
             sync_method = add_sync_version(method)
             setattr(self.__class__, f"{name}_sync", sync_method)
+
+
+def _type_url_suffix(message_type: type[Message]) -> str:
+    """Return the suffix of the Any type URL for `message_type`.
+
+    Any type URLs end in "/<full message name>"; the prefix is left to the
+    server. Callers compute this once at import time.
+    """
+    return "/" + message_type.DESCRIPTOR.full_name
+
+
+def _unpack_any(metadata_any: AnyPb2, type_suffix: str, message_type: type[MessageT]) -> MessageT | None:
+    """Parse an Any as `message_type` if its type URL ends in `type_suffix`.
+
+    This checks the type URL and parses the payload once, rather than going
+    through `Is()` and `Unpack()`, which each repeat the type check. The
+    message is only built once the type matches.
+
+    Returns:
+        The parsed message, or None if the Any holds a different type.
+    """
+    if not metadata_any.type_url.endswith(type_suffix):
+        return None
+    return message_type.FromString(metadata_any.value)
+
+
+DEFAULT_CHANNEL_OPTIONS: list[tuple[str, Any]] = [
+    # Ping every 5 minutes during calls so long control sessions don't stall on a
+    # dead link. gRPC servers reject more frequent or idle pings with GOAWAY.
+    ("grpc.keepalive_time_ms", 300000),
+    ("grpc.keepalive_timeout_ms", 20000),
+    # Let flow-control windows grow to the link's bandwidth-delay product.
+    ("grpc.http2.bdp_probe", 1),
+    ("grpc.max_receive_message_length", 32 << 20),
+]
+
+
+def _merge_options(*option_lists: Sequence[tuple[str, Any]] | None) -> list[tuple[str, Any]]:
+    """Merge channel option lists, with later values overriding earlier ones."""
+    merged: dict[str, Any] = {}
+    for options in option_lists:
+        merged.update(options or [])
+    return list(merged.items())
+
+
+def build_channel(target: str, options: Sequence[tuple[str, Any]] | None = None) -> grpc.aio.Channel:
+    """Open an insecure channel tuned for long-running, high-rate sessions.
+
+    This is opt-in: `KOS` and `ChannelPool` open plain channels unless given
+    options. Pass `DEFAULT_CHANNEL_OPTIONS` to a pool to apply the same tuning.
+
+    Args:
+        target: Address of the gRPC server, e.g. "localhost:50051".
+        options: Channel options that override or extend `DEFAULT_CHANNEL_OPTIONS`.
+
+    Returns:
+        The new channel.
+    """
+    return grpc.aio.insecure_channel(target, options=_merge_options(DEFAULT_CHANNEL_OPTIONS, options))
+
+
+class ChannelPool:
+    """A fixed-size pool of channels to the same target.
+
+    Each channel gets its own subchannel pool, so every channel is backed by a
+    separate HTTP/2 connection. Clients that accept a pool spread their RPCs over
+    the channels round-robin, which avoids head-of-line blocking between
+    concurrent callers sharing a single connection.
+
+    Args:
+        target: Address of the gRPC server, e.g. "localhost:50051".
+        size: Number of channels to open.
+        options: Channel options applied to every channel in the pool, e.g.
+            `DEFAULT_CHANNEL_OPTIONS`.
+    """
+
+    def __init__(self, target: str, size: int = 4, options: Sequence[tuple[str, Any]] | None = None) -> None:
+        if size < 1:
+            raise ValueError(f"Channel pool size must be at least 1, got {size}")
+        self.options = _merge_options(options, [("grpc.use_local_subchannel_pool", 1)])
+        self.channels = [grpc.aio.insecure_channel(target, options=self.options) for _ in range(size)]
+
+    async def close(self) -> None:
+        """Close every channel in the pool."""
+        await asyncio.gather(*(channel.close() for channel in self.channels))
+
+
+def get_channels(channel: grpc.aio.Channel | ChannelPool) -> list[grpc.aio.Channel]:
+    """Return the channels a client should dispatch over."""
+    if isinstance(channel, ChannelPool):
+        return channel.channels
+    return [channel]
+
+
+def serialized_unary_unary(
+    channels: list[grpc.aio.Channel],
+    method: str,
+    response_type: Any,  # noqa: ANN401
+) -> Iterator[grpc.aio.UnaryUnaryMultiCallable]:
+    """Build per-channel callables for a unary method that take pre-serialized requests.
+
+    grpc.aio serializes requests lazily from a background task, so a request message
+    that is reused across calls must be serialized before the call is started. The
+    callables are cycled so that `next()` alone picks the channel for each call.
+
+    Args:
+        channels: Channels to build a callable for.
+        method: Full method name, e.g. "/kos.actuator.ActuatorService/CommandActuators".
+        response_type: Protobuf message class of the response.
+
+    Returns:
+        An endless round-robin iterator over one callable per channel.
+    """
+    return itertools.cycle(
+        [
+            channel.unary_unary(method, request_serializer=None, response_deserializer=response_type.FromString)
+            for channel in channels
+        ]
+    )
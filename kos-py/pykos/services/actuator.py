@@ -1,6 +1,11 @@
 """Actuator service client."""
 
-from typing import NotRequired, TypedDict, Unpack
+import asyncio
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Literal, NotRequired, TypedDict, Unpack, overload
 
 import grpc
 import grpc.aio
@@ -9,7 +14,18 @@ from google.protobuf.any_pb2 import Any as AnyPb2
 
 from kos_protos import actuator_pb2, actuator_pb2_grpc, common_pb2
 from kos_protos.actuator_pb2 import CalibrateActuatorMetadata
-from pykos.services import AsyncClientBase
+from pykos.services import (
+    AsyncClientBase,
+    ChannelPool,
+    _type_url_suffix,
+    _unpack_any,
+    get_channels,
+    no_sync_version,
+    serialized_unary_unary,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ActuatorCommand(TypedDict):
@@ -37,12 +53,79 @@ class ActuatorStateRequest(TypedDict):
     actuator_ids: list[int]
 
 
+@dataclass(slots=True)
+class ActuatorState:
+    """Plain-attribute snapshot of an ActuatorStateResponse.
+
+    Unset optional fields are None.
+    """
+
+    actuator_id: int
+    online: bool
+    position: float | None
+    velocity: float | None
+    torque: float | None
+
+
+@dataclass(slots=True)
+class ActuatorStateArrays:
+    """Columnar actuator states, one array entry per actuator.
+
+    Unset positions, velocities and torques are NaN.
+    """
+
+    actuator_ids: "np.ndarray"
+    online: "np.ndarray"
+    positions: "np.ndarray"
+    velocities: "np.ndarray"
+    torques: "np.ndarray"
+
+
+def _wrap_states(response: actuator_pb2.GetActuatorsStateResponse) -> list[ActuatorState]:
+    states = []
+    for state in response.states:
+        has_field = state.HasField
+        states.append(
+            ActuatorState(
+                actuator_id=state.actuator_id,
+                online=state.online,
+                position=state.position if has_field("position") else None,
+                velocity=state.velocity if has_field("velocity") else None,
+                torque=state.torque if has_field("torque") else None,
+            )
+        )
+    return states
+
+
+def _to_arrays(response: actuator_pb2.GetActuatorsStateResponse) -> ActuatorStateArrays:
+    import numpy as np  # noqa: PLC0415 - numpy is an optional dependency
+
+    return ActuatorStateArrays(
+        actuator_ids=np.array(response.actuator_ids, dtype=np.uint32),
+        online=np.array(response.online, dtype=np.bool_),
+        positions=np.array(response.positions, dtype=np.float64),
+        velocities=np.array(response.velocities, dtype=np.float64),
+        torques=np.array(response.torques, dtype=np.float64),
+    )
+
+
+async def _stream_arrays(call: grpc.aio.UnaryStreamCall) -> AsyncIterator[ActuatorStateArrays]:
+    try:
+        async for response in call:
+            yield _to_arrays(response)
+    finally:
+        call.cancel()
+
+
 class CalibrationStatus:
     Calibrating = "calibrating"
     Calibrated = "calibrated"
     Timeout = "timeout"
 
 
+_CALIBRATION_METADATA_TYPE_SUFFIX = _type_url_suffix(CalibrateActuatorMetadata)
+
+
 class CalibrationMetadata:
     def __init__(self, metadata_any: AnyPb2) -> None:
         self.actuator_id: int | None = None
@@ -50,11 +133,11 @@ class CalibrationMetadata:
         self.decode_metadata(metadata_any)
 
     def decode_metadata(self, metadata_any: AnyPb2) -> None:
-        metadata = CalibrateActuatorMetadata()
-        if metadata_any.Is(CalibrateActuatorMetadata.DESCRIPTOR):
-            metadata_any.Unpack(metadata)
+        metadata = _unpack_any(metadata_any, _CALIBRATION_METADATA_TYPE_SUFFIX, CalibrateActuatorMetadata)
+        if metadata is not None:
             self.actuator_id = metadata.actuator_id
-            self.status = metadata.status if metadata.HasField("status") else None
+            # `status` is a plain proto3 string, so an empty string means unset.
+            self.status = metadata.status or None
 
     def __str__(self) -> str:
         return f"CalibrationMetadata(actuator_id={self.actuator_id}, status={self.status})"
@@ -63,25 +146,171 @@ class CalibrationMetadata:
         return self.__str__()
 
 
+def _add_commands(request: actuator_pb2.CommandActuatorsRequest, commands: list[ActuatorCommand]) -> None:
+    """Append commands to a request by setting fields directly, avoiding kwargs expansion."""
+    add = request.commands.add
+    for cmd in commands:
+        msg = add()
+        msg.actuator_id = cmd["actuator_id"]
+        if (position := cmd.get("position")) is not None:
+            msg.position = position
+        if (velocity := cmd.get("velocity")) is not None:
+            msg.velocity = velocity
+        if (torque := cmd.get("torque")) is not None:
+            msg.torque = torque
+
+
+def _set_config_fields(request: actuator_pb2.ConfigureActuatorRequest, config: ConfigureActuatorRequest) -> None:
+    """Copy the non-None entries of a configuration dict onto a request."""
+    for field, value in config.items():
+        if value is not None:
+            setattr(request, field, value)
+
+
+class _CommandStream:
+    """Coalesces queued actuator commands onto a persistent CommandActuatorsStream call.
+
+    Commands queued within `window` seconds of each other are merged into a single
+    request. Every caller whose commands went into a request receives that request's
+    response, matched by sequence ID.
+    """
+
+    def __init__(self, stub: actuator_pb2_grpc.ActuatorServiceStub, window: float) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._window = window
+        self._queue: asyncio.Queue[tuple[list[ActuatorCommand], asyncio.Future]] = asyncio.Queue()
+        self._pending: dict[int, list[asyncio.Future]] = {}
+        self._sequence_ids = itertools.count(1)
+        # Futures taken off the queue whose request has not been sent yet.
+        self._batch: list[asyncio.Future] = []
+        self._call = stub.CommandActuatorsStream(self._requests())
+        self._reader = asyncio.create_task(self._read_responses())
+
+    @property
+    def done(self) -> bool:
+        return self._reader.done()
+
+    def submit(self, commands: list[ActuatorCommand]) -> asyncio.Future:
+        future = self.loop.create_future()
+        if self.done:
+            future.set_exception(ConnectionError("Command stream closed"))
+        else:
+            self._queue.put_nowait((commands, future))
+        return future
+
+    async def _requests(self) -> AsyncIterator[actuator_pb2.CommandActuatorsRequest]:
+        while True:
+            batch = [await self._queue.get()]
+            self._batch = [batch[0][1]]
+            deadline = time.monotonic() + self._window
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                self._batch.append(batch[-1][1])
+
+            # The call may have ended while waiting out the window, in which
+            # case `_fail` has already resolved everything in `self._batch`.
+            if self.done:
+                return
+
+            request = actuator_pb2.CommandActuatorsRequest(sequence_id=next(self._sequence_ids))
+            for commands, _ in batch:
+                _add_commands(request, commands)
+            self._pending[request.sequence_id] = self._batch
+            self._batch = []
+            yield request
+
+    async def _read_responses(self) -> None:
+        error: Exception = ConnectionError("Command stream closed")
+        try:
+            async for response in self._call:
+                for future in self._pending.pop(response.sequence_id, []):
+                    if not future.done():
+                        future.set_result(response)
+        except grpc.aio.AioRpcError as e:
+            error = e
+        finally:
+            self._fail(error)
+
+    def _fail(self, exc: Exception) -> None:
+        futures = [future for futures in self._pending.values() for future in futures]
+        futures.extend(self._batch)
+        self._pending.clear()
+        self._batch = []
+        while not self._queue.empty():
+            futures.append(self._queue.get_nowait()[1])
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def close(self) -> None:
+        self._call.cancel()
+        try:
+            await self._reader
+        except asyncio.CancelledError:
+            pass
+
+
+class _RequestCache(threading.local):
+    """Per-thread request messages that are cleared and refilled on every call."""
+
+    def __init__(self) -> None:
+        self.command = actuator_pb2.CommandActuatorsRequest()
+        self.configure = actuator_pb2.ConfigureActuatorRequest()
+
+
 class ActuatorServiceClient(AsyncClientBase):
-    """Client for the ActuatorService."""
+    """Client for the ActuatorService.
+
+    For long-running control sessions, create the channel with `build_channel`,
+    or use `ChannelPool(..., options=DEFAULT_CHANNEL_OPTIONS)`, to get keepalive
+    and flow-control tuning.
+    """
 
-    def __init__(self, channel: grpc.aio.Channel) -> None:
+    def __init__(self, channel: grpc.aio.Channel | ChannelPool) -> None:
         super().__init__()
-        self.stub = actuator_pb2_grpc.ActuatorServiceStub(channel)
-        self.operations_stub = operations_pb2_grpc.OperationsStub(channel)
+        channels = get_channels(channel)
+        self.stubs = [actuator_pb2_grpc.ActuatorServiceStub(c) for c in channels]
+        self.operations_stubs = [operations_pb2_grpc.OperationsStub(c) for c in channels]
+        self.stub = self.stubs[0]
+        self.operations_stub = self.operations_stubs[0]
+        self._idx = itertools.count()
+        self._requests = _RequestCache()
+        self._get_op_req_cache: dict[int, operations_pb2.GetOperationRequest] = {}
+        self._all_state_req = actuator_pb2.GetActuatorsStateRequest().SerializeToString()
+        self._all_state_columnar_req = actuator_pb2.GetActuatorsStateRequest(columnar=True).SerializeToString()
+        self._command_calls = serialized_unary_unary(
+            channels, "/kos.actuator.ActuatorService/CommandActuators", actuator_pb2.CommandActuatorsResponse
+        )
+        self._configure_calls = serialized_unary_unary(
+            channels, "/kos.actuator.ActuatorService/ConfigureActuator", common_pb2.ActionResponse
+        )
+        self._state_calls = serialized_unary_unary(
+            channels, "/kos.actuator.ActuatorService/GetActuatorsState", actuator_pb2.GetActuatorsStateResponse
+        )
+        self._command_stream: _CommandStream | None = None
+
+    def _stub(self) -> actuator_pb2_grpc.ActuatorServiceStub:
+        return self.stubs[next(self._idx) % len(self.stubs)]
+
+    def _operations_stub(self) -> operations_pb2_grpc.OperationsStub:
+        return self.operations_stubs[next(self._idx) % len(self.operations_stubs)]
 
     async def calibrate(self, actuator_id: int) -> CalibrationMetadata:
         """Calibrate an actuator."""
-        response = await self.stub.CalibrateActuator(actuator_pb2.CalibrateActuatorRequest(actuator_id=actuator_id))
+        response = await self._stub().CalibrateActuator(actuator_pb2.CalibrateActuatorRequest(actuator_id=actuator_id))
         metadata = CalibrationMetadata(response.metadata)
         return metadata
 
     async def get_calibration_status(self, actuator_id: int) -> str | None:
         """Get the calibration status of an actuator."""
-        response = await self.operations_stub.GetOperation(
-            operations_pb2.GetOperationRequest(name=f"operations/calibrate_actuator/{actuator_id}")
-        )
+        request = self._get_op_req_cache.get(actuator_id)
+        if request is None:
+            request = operations_pb2.GetOperationRequest(name=f"operations/calibrate_actuator/{actuator_id}")
+            self._get_op_req_cache[actuator_id] = request
+        response = await self._operations_stub().GetOperation(request)
         metadata = CalibrationMetadata(response.metadata)
         return metadata.status
 
@@ -102,9 +331,46 @@ class ActuatorServiceClient(AsyncClientBase):
         Returns:
             List of ActionResult objects indicating success/failure for each command.
         """
-        actuator_commands = [actuator_pb2.ActuatorCommand(**cmd) for cmd in commands]
-        request = actuator_pb2.CommandActuatorsRequest(commands=actuator_commands)
-        return await self.stub.CommandActuators(request)
+        request = self._requests.command
+        request.Clear()
+        _add_commands(request, commands)
+        return await next(self._command_calls)(request.SerializeToString())
+
+    @no_sync_version
+    async def command_actuators_stream(
+        self,
+        commands: list[ActuatorCommand],
+        window: float = 0.001,
+    ) -> actuator_pb2.CommandActuatorsResponse:
+        """Command actuators over a persistent stream instead of a unary RPC.
+
+        Commands submitted within `window` seconds of each other, possibly from
+        several concurrent callers, are coalesced into a single request. This is
+        the preferred path for high-frequency control loops.
+
+        Example:
+            >>> await command_actuators_stream([
+            ...     {"actuator_id": 1, "position": 90.0},
+            ... ])
+
+        Args:
+            commands: List of actuator commands, as in `command_actuators`.
+            window: Coalescing window in seconds, used when the stream is opened.
+
+        Returns:
+            The response to the coalesced request the commands were sent in.
+        """
+        stream = self._command_stream
+        if stream is None or stream.done or stream.loop is not asyncio.get_running_loop():
+            stream = self._command_stream = _CommandStream(self._stub(), window)
+        return await stream.submit(commands)
+
+    @no_sync_version
+    async def close_command_stream(self) -> None:
+        """Close the stream opened by `command_actuators_stream`, if any."""
+        if self._command_stream is not None:
+            stream, self._command_stream = self._command_stream, None
+            await stream.close()
 
     async def configure_actuator(self, **kwargs: Unpack[ConfigureActuatorRequest]) -> common_pb2.ActionResult:
         """Configure an actuator's parameters.
@@ -140,8 +406,35 @@ class ActuatorServiceClient(AsyncClientBase):
         Returns:
             ActionResponse indicating success/failure
         """
-        request = actuator_pb2.ConfigureActuatorRequest(**kwargs)
-        return await self.stub.ConfigureActuator(request)
+        request = self._requests.configure
+        request.Clear()
+        _set_config_fields(request, kwargs)
+        return await next(self._configure_calls)(request.SerializeToString())
+
+    async def configure_actuators(
+        self,
+        configs: list[ConfigureActuatorRequest],
+    ) -> actuator_pb2.ConfigureActuatorsResponse:
+        """Configure several actuators in a single call.
+
+        Example:
+            >>> configure_actuators([
+            ...     {"actuator_id": 1, "kp": 1.0, "kd": 0.1, "torque_enabled": True},
+            ...     {"actuator_id": 2, "kp": 2.0, "kd": 0.2, "torque_enabled": True},
+            ... ])
+
+        Args:
+            configs: List of configurations, each taking the same keys as
+                     `configure_actuator`.
+
+        Returns:
+            ConfigureActuatorsResponse with one ActionResult per configuration, in order
+        """
+        request = actuator_pb2.ConfigureActuatorsRequest()
+        add = request.configs.add
+        for config in configs:
+            _set_config_fields(add(), config)
+        return await self._stub().ConfigureActuators(request)
 
     async def get_actuators_state(
         self,
@@ -149,6 +442,10 @@ class ActuatorServiceClient(AsyncClientBase):
     ) -> actuator_pb2.GetActuatorsStateResponse:
         """Get the state of multiple actuators.
 
+        The server gzip-compresses these polled state responses (but not
+        `stream_actuators_state` frames), which mainly helps when querying many
+        actuators over a slow link.
+
         Example:
             >>> get_actuators_state([1, 2])
 
@@ -158,5 +455,99 @@ class ActuatorServiceClient(AsyncClientBase):
         Returns:
             List of ActuatorStateResponse objects containing the state information
         """
-        request = actuator_pb2.GetActuatorsStateRequest(actuator_ids=actuator_ids or [])
-        return await self.stub.GetActuatorsState(request)
+        if not actuator_ids:
+            return await next(self._state_calls)(self._all_state_req)
+        request = actuator_pb2.GetActuatorsStateRequest(actuator_ids=actuator_ids)
+        return await next(self._state_calls)(request.SerializeToString())
+
+    async def get_actuators_state_fast(self, actuator_ids: list[int] | None = None) -> list[ActuatorState]:
+        """Get the state of multiple actuators as plain dataclasses.
+
+        Each protobuf field is read once when the response arrives, so scanning
+        the result repeatedly is cheaper than iterating the raw response.
+
+        Args:
+            actuator_ids: List of actuator IDs to query. If None, gets state of all actuators.
+
+        Returns:
+            List of ActuatorState objects, in the order returned by the server
+        """
+        return _wrap_states(await self.get_actuators_state(actuator_ids))
+
+    async def get_actuators_state_np(self, actuator_ids: list[int] | None = None) -> ActuatorStateArrays:
+        """Get the state of multiple actuators as numpy arrays.
+
+        The server packs each field into its own repeated column instead of
+        sending one message per actuator, so decoding costs one array conversion
+        per field rather than a Python object per actuator. Requires numpy.
+
+        Example:
+            >>> state = await get_actuators_state_np([1, 2])
+            >>> state.positions
+            array([ 90., 180.])
+
+        Args:
+            actuator_ids: List of actuator IDs to query. If None, gets state of all actuators.
+
+        Returns:
+            ActuatorStateArrays holding one entry per actuator, in the order returned by the server
+        """
+        if actuator_ids:
+            request = actuator_pb2.GetActuatorsStateRequest(actuator_ids=actuator_ids, columnar=True)
+            response = await next(self._state_calls)(request.SerializeToString())
+        else:
+            response = await next(self._state_calls)(self._all_state_columnar_req)
+        return _to_arrays(response)
+
+    @overload
+    def stream_actuators_state(
+        self,
+        actuator_ids: list[int] | None = ...,
+        hz: float = ...,
+        columnar: Literal[False] = ...,
+    ) -> AsyncIterator[actuator_pb2.GetActuatorsStateResponse]: ...
+
+    @overload
+    def stream_actuators_state(
+        self,
+        actuator_ids: list[int] | None = ...,
+        hz: float = ...,
+        *,
+        columnar: Literal[True],
+    ) -> AsyncIterator[ActuatorStateArrays]: ...
+
+    def stream_actuators_state(
+        self,
+        actuator_ids: list[int] | None = None,
+        hz: float = 100.0,
+        columnar: bool = False,
+    ) -> AsyncIterator[actuator_pb2.GetActuatorsStateResponse] | AsyncIterator[ActuatorStateArrays]:
+        """Stream the state of multiple actuators at a fixed rate.
+
+        The server pushes a new state every 1 / hz seconds until the iterator is
+        closed, so there is no per-sample request overhead. This is the preferred
+        path for telemetry above ~50 Hz; use `get_actuators_state` for single-shot
+        queries.
+
+        Example:
+            >>> async for state in stream_actuators_state([1, 2], hz=200.0):
+            ...     print(state.states)
+
+        Args:
+            actuator_ids: List of actuator IDs to query. If None, streams state of all actuators.
+            hz: Update rate in Hz.
+            columnar: If True, the server sends columnar responses, which are
+                yielded as ActuatorStateArrays as in `get_actuators_state_np`.
+                Requires numpy.
+
+        Returns:
+            Async iterator over GetActuatorsStateResponse messages, or over
+            ActuatorStateArrays if `columnar` is set.
+        """
+        request = actuator_pb2.StreamActuatorsStateRequest(
+            actuator_ids=actuator_ids or [],
+            frequency=hz,
+            columnar=columnar,
+        )
+        call = self._stub().StreamActuatorsState(request)
+        return _stream_arrays(call) if columnar else call
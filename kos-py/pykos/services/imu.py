@@ -11,7 +11,7 @@ from google.protobuf.empty_pb2 import Empty
 
 from kos_protos import common_pb2, imu_pb2, imu_pb2_grpc
 from kos_protos.imu_pb2 import CalibrateIMUMetadata
-from pykos.services import AsyncClientBase
+from pykos.services import AsyncClientBase, _type_url_suffix, _unpack_any
 
 
 class ZeroIMURequest(TypedDict):
@@ -27,16 +27,19 @@ class CalibrationStatus:
     FAILED = "FAILED"
 
 
+_CALIBRATION_METADATA_TYPE_SUFFIX = _type_url_suffix(CalibrateIMUMetadata)
+
+
 class CalibrationMetadata:
     def __init__(self, metadata_any: AnyPb2) -> None:
         self.status: str | None = None
         self.decode_metadata(metadata_any)
 
     def decode_metadata(self, metadata_any: AnyPb2) -> None:
-        metadata = CalibrateIMUMetadata()
-        if metadata_any.Is(CalibrateIMUMetadata.DESCRIPTOR):
-            metadata_any.Unpack(metadata)
-            self.status = metadata.status if metadata.HasField("status") else None
+        metadata = _unpack_any(metadata_any, _CALIBRATION_METADATA_TYPE_SUFFIX, CalibrateIMUMetadata)
+        if metadata is not None:
+            # `status` is a plain proto3 string, so an empty string means unset.
+            self.status = metadata.status or None
 
     def __str__(self) -> str:
         return f"CalibrationMetadata(status={self.status})"
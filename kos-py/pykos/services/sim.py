@@ -1,16 +1,19 @@
 """Sim service client."""
 
-from typing import NotRequired, TypedDict, Unpack
+import itertools
+import threading
+from typing import Any, NotRequired, TypedDict
 
 import grpc
 import grpc.aio
 from google.protobuf.empty_pb2 import Empty
 
 from kos_protos import common_pb2, sim_pb2, sim_pb2_grpc
-from pykos.services import AsyncClientBase
+from pykos.services import AsyncClientBase, ChannelPool, get_channels, serialized_unary_unary
 
 
 class DefaultPosition(TypedDict):
+    # Any float sequence works; numpy arrays are converted with `tolist()`.
     qpos: list[float]
 
 
@@ -30,21 +33,126 @@ class SimulationParameters(TypedDict):
     initial_state: NotRequired[DefaultPosition]
 
 
+def _extend_qpos(field: Any, qpos: Any) -> None:  # noqa: ANN401
+    # The upb runtime extends repeated fields fastest from a list. Arrays that
+    # offer `tolist()` (numpy arrays, array.array) convert in a single C call,
+    # which beats feeding them to `extend` element by element.
+    tolist = getattr(qpos, "tolist", None)
+    field.extend(tolist() if tolist is not None else qpos)
+
+
+# Wire encodings of requests with no fields set, sent as-is for empty updates.
+_EMPTY_RESET_REQUEST = sim_pb2.ResetRequest().SerializeToString()
+_EMPTY_SET_PARAMETERS_REQUEST = sim_pb2.SetParametersRequest(
+    parameters=sim_pb2.SimulationParameters()
+).SerializeToString()
+
+
+class StepStream:
+    """A persistent StepStream call to the simulation.
+
+    Each request sent on the stream steps the simulation and produces exactly one
+    StepResponse, so `send` and `recv` calls should be paired. Use as an async
+    context manager, or call `close` when done.
+    """
+
+    def __init__(self, stub: sim_pb2_grpc.SimulationServiceStub) -> None:
+        self._call = stub.StepStream()
+
+    async def send(self, num_steps: int = 1, step_size: float | None = None) -> None:
+        """Send a step request without waiting for its response.
+
+        Args:
+            num_steps: Number of simulation steps to take
+            step_size: Optional time per step in seconds
+        """
+        request = sim_pb2.StepRequest(num_steps=num_steps)
+        if step_size is not None:
+            request.step_size = step_size
+        await self._call.write(request)
+
+    async def recv(self) -> sim_pb2.StepResponse:
+        """Receive the response to the oldest outstanding step request.
+
+        Returns:
+            StepResponse containing the simulation state after the step
+        """
+        response = await self._call.read()
+        if response is grpc.aio.EOF:
+            raise ConnectionError("Step stream closed by the server")
+        return response
+
+    async def step(self, num_steps: int = 1, step_size: float | None = None) -> sim_pb2.StepResponse:
+        """Step the simulation and wait for the resulting state.
+
+        Args:
+            num_steps: Number of simulation steps to take
+            step_size: Optional time per step in seconds
+
+        Returns:
+            StepResponse containing the simulation state after the step
+        """
+        await self.send(num_steps, step_size)
+        return await self.recv()
+
+    async def close(self) -> None:
+        """Finish sending requests and wait for the call to complete."""
+        await self._call.done_writing()
+        await self._call.code()
+
+    async def __aenter__(self) -> "StepStream":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:  # noqa: ANN401
+        if exc_type is None:
+            await self.close()
+        else:
+            self._call.cancel()
+
+
+class _RequestCache(threading.local):
+    """Per-thread request messages that are cleared and refilled on every call."""
+
+    def __init__(self) -> None:
+        self.reset = sim_pb2.ResetRequest()
+        self.step = sim_pb2.StepRequest()
+        self.set_parameters = sim_pb2.SetParametersRequest()
+
+
 class SimServiceClient(AsyncClientBase):
     """Client for the SimulationService."""
 
-    def __init__(self, channel: grpc.aio.Channel) -> None:
+    def __init__(self, channel: grpc.aio.Channel | ChannelPool) -> None:
         super().__init__()
 
-        self.stub = sim_pb2_grpc.SimulationServiceStub(channel)
+        channels = get_channels(channel)
+        self.stubs = [sim_pb2_grpc.SimulationServiceStub(c) for c in channels]
+        self.stub = self.stubs[0]
+        self._idx = itertools.count()
+        self._requests = _RequestCache()
+        self._reset_calls = serialized_unary_unary(
+            channels, "/kos.sim.SimulationService/Reset", common_pb2.ActionResponse
+        )
+        self._step_calls = serialized_unary_unary(
+            channels, "/kos.sim.SimulationService/Step", common_pb2.ActionResponse
+        )
+        self._set_parameters_calls = serialized_unary_unary(
+            channels, "/kos.sim.SimulationService/SetParameters", common_pb2.ActionResponse
+        )
+
+    def _stub(self) -> sim_pb2_grpc.SimulationServiceStub:
+        return self.stubs[next(self._idx) % len(self.stubs)]
 
-    async def reset(self, **kwargs: Unpack[ResetRequest]) -> common_pb2.ActionResponse:
+    async def reset(
+        self,
+        initial_state: DefaultPosition | None = None,
+        randomize: bool | None = None,
+    ) -> common_pb2.ActionResponse:
         """Reset the simulation to its initial state.
 
         Args:
-            **kwargs: Reset parameters that may include:
-                     initial_state: DefaultPosition to reset to
-                     randomize: Whether to randomize the initial state
+            initial_state: DefaultPosition to reset to
+            randomize: Whether to randomize the initial state
 
         Example:
             >>> client.reset(
@@ -55,13 +163,17 @@ class SimServiceClient(AsyncClientBase):
         Returns:
             ActionResponse indicating success/failure
         """
-        initial_state = None
-        if "initial_state" in kwargs:
-            pos = kwargs["initial_state"]
-            initial_state = sim_pb2.DefaultPosition(qpos=pos["qpos"])
-
-        request = sim_pb2.ResetRequest(initial_state=initial_state, randomize=kwargs.get("randomize"))
-        return await self.stub.Reset(request)
+        if initial_state is None and randomize is None:
+            return await next(self._reset_calls)(_EMPTY_RESET_REQUEST)
+
+        request = self._requests.reset
+        request.Clear()
+        if initial_state is not None:
+            request.initial_state.SetInParent()
+            _extend_qpos(request.initial_state.qpos, initial_state["qpos"])
+        if randomize is not None:
+            request.randomize = randomize
+        return await next(self._reset_calls)(request.SerializeToString())
 
     async def set_paused(self, paused: bool) -> common_pb2.ActionResponse:
         """Pause or unpause the simulation.
@@ -73,7 +185,7 @@ class SimServiceClient(AsyncClientBase):
             ActionResponse indicating success/failure
         """
         request = sim_pb2.SetPausedRequest(paused=paused)
-        return await self.stub.SetPaused(request)
+        return await self._stub().SetPaused(request)
 
     async def step(self, num_steps: int, step_size: float | None = None) -> common_pb2.ActionResponse:
         """Step the simulation forward.
@@ -85,10 +197,36 @@ class SimServiceClient(AsyncClientBase):
         Returns:
             ActionResponse indicating success/failure
         """
-        request = sim_pb2.StepRequest(num_steps=num_steps, step_size=step_size)
-        return await self.stub.Step(request)
+        request = self._requests.step
+        request.Clear()
+        request.num_steps = num_steps
+        if step_size is not None:
+            request.step_size = step_size
+        return await next(self._step_calls)(request.SerializeToString())
 
-    async def set_parameters(self, **kwargs: Unpack[SimulationParameters]) -> common_pb2.ActionResponse:
+    def step_stream(self) -> StepStream:
+        """Open a stream for stepping the simulation with per-step feedback.
+
+        Every step costs a single message on an open stream rather than a full
+        RPC round trip, which makes this the preferred path for RL rollouts and
+        other loops that step once per observation.
+
+        Example:
+            >>> async with client.step_stream() as stream:
+            ...     for _ in range(1000):
+            ...         state = await stream.step(num_steps=1)
+
+        Returns:
+            StepStream wrapping the open call
+        """
+        return StepStream(self._stub())
+
+    async def set_parameters(
+        self,
+        time_scale: float | None = None,
+        gravity: float | None = None,
+        initial_state: DefaultPosition | None = None,
+    ) -> common_pb2.ActionResponse:
         """Set simulation parameters.
 
         Example:
@@ -99,24 +237,28 @@ class SimServiceClient(AsyncClientBase):
         ... )
 
         Args:
-            **kwargs: Parameters that may include:
-                     time_scale: Simulation time scale
-                     gravity: Gravity constant
-                     initial_state: Default position state
+            time_scale: Simulation time scale
+            gravity: Gravity constant
+            initial_state: Default position state
 
         Returns:
             ActionResponse indicating success/failure
         """
-        initial_state = None
-        if "initial_state" in kwargs:
-            pos = kwargs["initial_state"]
-            initial_state = sim_pb2.DefaultPosition(qpos=pos["qpos"])
-
-        params = sim_pb2.SimulationParameters(
-            time_scale=kwargs.get("time_scale"), gravity=kwargs.get("gravity"), initial_state=initial_state
-        )
-        request = sim_pb2.SetParametersRequest(parameters=params)
-        return await self.stub.SetParameters(request)
+        if time_scale is None and gravity is None and initial_state is None:
+            return await next(self._set_parameters_calls)(_EMPTY_SET_PARAMETERS_REQUEST)
+
+        request = self._requests.set_parameters
+        request.Clear()
+        params = request.parameters
+        params.SetInParent()
+        if time_scale is not None:
+            params.time_scale = time_scale
+        if gravity is not None:
+            params.gravity = gravity
+        if initial_state is not None:
+            params.initial_state.SetInParent()
+            _extend_qpos(params.initial_state.qpos, initial_state["qpos"])
+        return await next(self._set_parameters_calls)(request.SerializeToString())
 
     async def get_parameters(self) -> sim_pb2.GetParametersResponse:
         """Get current simulation parameters.
@@ -124,4 +266,4 @@ class SimServiceClient(AsyncClientBase):
         Returns:
             GetParametersResponse containing current parameters and any error
         """
-        return await self.stub.GetParameters(Empty())
+        return await self._stub().GetParameters(Empty())
@@ -0,0 +1,274 @@
+"""Tests the actuator service client against an in-process gRPC server."""
+
+import asyncio
+from typing import AsyncIterator
+
+import grpc
+import grpc.aio
+import pytest
+import pytest_asyncio
+from google.protobuf.any_pb2 import Any as AnyPb2
+
+from kos_protos import actuator_pb2, actuator_pb2_grpc, common_pb2
+from pykos.services import DEFAULT_CHANNEL_OPTIONS, ChannelPool, _merge_options
+from pykos.services.actuator import ActuatorServiceClient, ActuatorState, CalibrationMetadata, _wrap_states
+
+
+class FakeActuatorService(actuator_pb2_grpc.ActuatorServiceServicer):
+    def __init__(self) -> None:
+        self.requests: list[actuator_pb2.CommandActuatorsRequest] = []
+        self.configs: list[actuator_pb2.ConfigureActuatorRequest] = []
+        # If set, the command stream is ended this many seconds after its first response.
+        self.stream_lifetime: float | None = None
+
+    def _respond(self, request: actuator_pb2.CommandActuatorsRequest) -> actuator_pb2.CommandActuatorsResponse:
+        self.requests.append(request)
+        return actuator_pb2.CommandActuatorsResponse(
+            results=[common_pb2.ActionResult(actuator_id=cmd.actuator_id, success=True) for cmd in request.commands],
+            sequence_id=request.sequence_id,
+        )
+
+    async def CommandActuators(  # noqa: N802
+        self,
+        request: actuator_pb2.CommandActuatorsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> actuator_pb2.CommandActuatorsResponse:
+        return self._respond(request)
+
+    async def CommandActuatorsStream(  # noqa: N802
+        self,
+        request_iterator: AsyncIterator[actuator_pb2.CommandActuatorsRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[actuator_pb2.CommandActuatorsResponse]:
+        async for request in request_iterator:
+            yield self._respond(request)
+            if self.stream_lifetime is not None:
+                await asyncio.sleep(self.stream_lifetime)
+                return
+
+    async def ConfigureActuators(  # noqa: N802
+        self,
+        request: actuator_pb2.ConfigureActuatorsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> actuator_pb2.ConfigureActuatorsResponse:
+        self.configs.extend(request.configs)
+        results = [common_pb2.ActionResult(actuator_id=c.actuator_id, success=True) for c in request.configs]
+        return actuator_pb2.ConfigureActuatorsResponse(results=results)
+
+    async def GetActuatorsState(  # noqa: N802
+        self,
+        request: actuator_pb2.GetActuatorsStateRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> actuator_pb2.GetActuatorsStateResponse:
+        assert request.columnar
+        return actuator_pb2.GetActuatorsStateResponse(
+            actuator_ids=request.actuator_ids,
+            online=[True] * len(request.actuator_ids),
+            positions=[float(i) for i in request.actuator_ids],
+            velocities=[0.0] * len(request.actuator_ids),
+            torques=[float("nan")] * len(request.actuator_ids),
+        )
+
+    async def StreamActuatorsState(  # noqa: N802
+        self,
+        request: actuator_pb2.StreamActuatorsStateRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[actuator_pb2.GetActuatorsStateResponse]:
+        for step in range(3):
+            if request.columnar:
+                yield actuator_pb2.GetActuatorsStateResponse(
+                    actuator_ids=request.actuator_ids,
+                    positions=[float(step)] * len(request.actuator_ids),
+                )
+            else:
+                states = [
+                    actuator_pb2.ActuatorStateResponse(actuator_id=i, position=step) for i in request.actuator_ids
+                ]
+                yield actuator_pb2.GetActuatorsStateResponse(states=states)
+            await asyncio.sleep(1.0 / request.frequency)
+
+
+@pytest_asyncio.fixture
+async def actuator_server() -> AsyncIterator[tuple[FakeActuatorService, grpc.aio.Channel]]:
+    service = FakeActuatorService()
+    server = grpc.aio.server()
+    actuator_pb2_grpc.add_ActuatorServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield service, channel
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_command_actuators_stream(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    service, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    # Concurrent callers within the window are coalesced into a single request.
+    responses = await asyncio.gather(
+        client.command_actuators_stream([{"actuator_id": 1, "position": 1.0}], window=0.05),
+        client.command_actuators_stream([{"actuator_id": 2, "position": 2.0}], window=0.05),
+    )
+    assert len(service.requests) == 1
+    assert [cmd.actuator_id for cmd in service.requests[0].commands] == [1, 2]
+    assert responses[0] == responses[1]
+    assert [result.actuator_id for result in responses[0].results] == [1, 2]
+
+    # Later calls reuse the same stream with a new sequence ID.
+    response = await client.command_actuators_stream([{"actuator_id": 3}])
+    assert response.sequence_id == service.requests[-1].sequence_id == 2
+
+    await client.close_command_stream()
+
+
+@pytest.mark.asyncio
+async def test_command_actuators_stream_closed_mid_window(
+    actuator_server: tuple[FakeActuatorService, grpc.aio.Channel],
+) -> None:
+    service, channel = actuator_server
+    service.stream_lifetime = 0.02
+    client = ActuatorServiceClient(channel)
+
+    await client.command_actuators_stream([{"actuator_id": 1}], window=0.2)
+
+    # This call is still waiting out the window when the server ends the stream.
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(client.command_actuators_stream([{"actuator_id": 2}]), timeout=1.0)
+    assert len(service.requests) == 1
+
+    # The next call opens a fresh stream.
+    service.stream_lifetime = None
+    response = await client.command_actuators_stream([{"actuator_id": 3}])
+    assert [result.actuator_id for result in response.results] == [3]
+    await client.close_command_stream()
+
+
+@pytest.mark.asyncio
+async def test_command_stream_has_no_sync_version(
+    actuator_server: tuple[FakeActuatorService, grpc.aio.Channel],
+) -> None:
+    client = ActuatorServiceClient(actuator_server[1])
+    assert hasattr(client, "command_actuators_sync")
+    assert not hasattr(client, "command_actuators_stream_sync")
+    assert not hasattr(client, "close_command_stream_sync")
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_round_robin() -> None:
+    pool = ChannelPool("127.0.0.1:0", size=3)
+    client = ActuatorServiceClient(pool)
+    assert len(client.stubs) == 3
+    assert [client._stub() for _ in range(4)] == [*client.stubs, client.stubs[0]]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_options() -> None:
+    pool = ChannelPool("127.0.0.1:0", size=1)
+    assert pool.options == [("grpc.use_local_subchannel_pool", 1)]
+    await pool.close()
+
+    pool = ChannelPool("127.0.0.1:0", size=1, options=DEFAULT_CHANNEL_OPTIONS)
+    assert pool.options == [*DEFAULT_CHANNEL_OPTIONS, ("grpc.use_local_subchannel_pool", 1)]
+    await pool.close()
+
+
+def test_merge_options() -> None:
+    merged = _merge_options(
+        DEFAULT_CHANNEL_OPTIONS, [("grpc.keepalive_time_ms", 600000), ("grpc.primary_user_agent", "kos")]
+    )
+    assert dict(merged) == {
+        **dict(DEFAULT_CHANNEL_OPTIONS),
+        "grpc.keepalive_time_ms": 600000,
+        "grpc.primary_user_agent": "kos",
+    }
+    assert len(merged) == len(DEFAULT_CHANNEL_OPTIONS) + 1
+    assert _merge_options(None, []) == []
+
+
+@pytest.mark.asyncio
+async def test_command_actuators_reuses_request(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    service, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    # The cached request is refilled by each call, so concurrent calls must not clobber each other.
+    responses = await asyncio.gather(*(client.command_actuators([{"actuator_id": i, "torque": 0.5}]) for i in range(4)))
+    assert [response.results[0].actuator_id for response in responses] == [0, 1, 2, 3]
+    assert sorted(request.commands[0].actuator_id for request in service.requests) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stream_actuators_state(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    _, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    positions = [
+        [state.position for state in response.states]
+        async for response in client.stream_actuators_state([1, 2], hz=1000.0)
+    ]
+    assert positions == [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]]
+
+
+@pytest.mark.asyncio
+async def test_stream_actuators_state_columnar(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    np = pytest.importorskip("numpy")
+    _, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    states = [state async for state in client.stream_actuators_state([1, 2], hz=1000.0, columnar=True)]
+    assert len(states) == 3
+    np.testing.assert_array_equal(states[2].actuator_ids, [1, 2])
+    np.testing.assert_array_equal(states[2].positions, [2.0, 2.0])
+
+
+def test_wrap_states() -> None:
+    response = actuator_pb2.GetActuatorsStateResponse(
+        states=[
+            actuator_pb2.ActuatorStateResponse(actuator_id=1, online=True, position=1.5, torque=0.0),
+            actuator_pb2.ActuatorStateResponse(actuator_id=2),
+        ]
+    )
+    assert _wrap_states(response) == [
+        ActuatorState(actuator_id=1, online=True, position=1.5, velocity=None, torque=0.0),
+        ActuatorState(actuator_id=2, online=False, position=None, velocity=None, torque=None),
+    ]
+
+
+def test_calibration_metadata() -> None:
+    metadata_any = AnyPb2()
+    metadata_any.Pack(actuator_pb2.CalibrateActuatorMetadata(actuator_id=3, status="calibrating"))
+    metadata = CalibrationMetadata(metadata_any)
+    assert (metadata.actuator_id, metadata.status) == (3, "calibrating")
+
+    metadata_any.Pack(actuator_pb2.CalibrateActuatorMetadata(actuator_id=3))
+    assert CalibrationMetadata(metadata_any).status is None
+
+    metadata_any.Pack(common_pb2.Error(message="not calibration metadata"))
+    assert CalibrationMetadata(metadata_any).actuator_id is None
+
+
+@pytest.mark.asyncio
+async def test_get_actuators_state_np(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    np = pytest.importorskip("numpy")
+    _, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    state = await client.get_actuators_state_np([1, 2])
+    np.testing.assert_array_equal(state.actuator_ids, [1, 2])
+    np.testing.assert_array_equal(state.positions, [1.0, 2.0])
+    assert state.positions.dtype == np.float64
+    assert state.online.all() and np.isnan(state.torques).all()
+
+
+@pytest.mark.asyncio
+async def test_configure_actuators(actuator_server: tuple[FakeActuatorService, grpc.aio.Channel]) -> None:
+    service, channel = actuator_server
+    client = ActuatorServiceClient(channel)
+
+    response = await client.configure_actuators(
+        [{"actuator_id": 1, "kp": 1.0, "torque_enabled": True}, {"actuator_id": 2}]
+    )
+    assert [result.actuator_id for result in response.results] == [1, 2]
+    assert service.configs[0].kp == 1.0 and service.configs[0].torque_enabled
+    assert not service.configs[1].HasField("kd")
@@ -0,0 +1,18 @@
+"""Tests the IMU service client helpers."""
+
+from google.protobuf.any_pb2 import Any as AnyPb2
+
+from kos_protos import common_pb2, imu_pb2
+from pykos.services.imu import CalibrationMetadata
+
+
+def test_calibration_metadata() -> None:
+    metadata_any = AnyPb2()
+    metadata_any.Pack(imu_pb2.CalibrateIMUMetadata(status="calibrating"))
+    assert CalibrationMetadata(metadata_any).status == "calibrating"
+
+    metadata_any.Pack(imu_pb2.CalibrateIMUMetadata())
+    assert CalibrationMetadata(metadata_any).status is None
+
+    metadata_any.Pack(common_pb2.Error(message="not calibration metadata"))
+    assert CalibrationMetadata(metadata_any).status is None
@@ -10,6 +10,17 @@ def test_dummy() -> None:
     assert True
 
 
+@pytest.mark.asyncio
+async def test_kos_channel_options() -> None:
+    async with pykos.KOS("127.0.0.1", port=0, num_channels=2) as client:
+        assert client._pool is not None
+        assert client._pool.options == [("grpc.use_local_subchannel_pool", 1)]
+
+    async with pykos.KOS("127.0.0.1", port=0, channel_options=pykos.DEFAULT_CHANNEL_OPTIONS) as client:
+        assert client._pool is not None
+        assert client._pool.options == [*pykos.DEFAULT_CHANNEL_OPTIONS, ("grpc.use_local_subchannel_pool", 1)]
+
+
 @pytest.mark.asyncio
 async def test_pykos() -> None:
     # In order to test this client, you should run the stub KOS server.
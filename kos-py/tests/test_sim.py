@@ -0,0 +1,77 @@
+"""Tests the sim service client against an in-process gRPC server."""
+
+from typing import AsyncIterator
+
+import grpc
+import grpc.aio
+import pytest
+import pytest_asyncio
+
+from kos_protos import common_pb2, sim_pb2, sim_pb2_grpc
+from pykos.services.sim import SimServiceClient
+
+
+class FakeSimService(sim_pb2_grpc.SimulationServiceServicer):
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.parameters: list[sim_pb2.SimulationParameters] = []
+
+    async def SetParameters(  # noqa: N802
+        self,
+        request: sim_pb2.SetParametersRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> common_pb2.ActionResponse:
+        self.parameters.append(request.parameters)
+        return common_pb2.ActionResponse(success=True)
+
+    async def StepStream(  # noqa: N802
+        self,
+        request_iterator: AsyncIterator[sim_pb2.StepRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[sim_pb2.StepResponse]:
+        async for request in request_iterator:
+            self.time += request.num_steps * (request.step_size if request.HasField("step_size") else 0.001)
+            yield sim_pb2.StepResponse(qpos=[self.time], time=self.time)
+
+
+@pytest_asyncio.fixture
+async def sim_server() -> AsyncIterator[tuple[FakeSimService, grpc.aio.Channel]]:
+    service = FakeSimService()
+    server = grpc.aio.server()
+    sim_pb2_grpc.add_SimulationServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield service, channel
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_step_stream(sim_server: tuple[FakeSimService, grpc.aio.Channel]) -> None:
+    _, channel = sim_server
+    client = SimServiceClient(channel)
+
+    async with client.step_stream() as stream:
+        first = await stream.step(num_steps=2, step_size=0.5)
+        assert first.time == pytest.approx(1.0)
+
+        # Requests can be pipelined ahead of their responses.
+        await stream.send(num_steps=1, step_size=0.25)
+        await stream.send(num_steps=1, step_size=0.25)
+        assert (await stream.recv()).time == pytest.approx(1.25)
+        assert (await stream.recv()).time == pytest.approx(1.5)
+
+
+@pytest.mark.asyncio
+async def test_set_parameters_sets_only_given_fields(sim_server: tuple[FakeSimService, grpc.aio.Channel]) -> None:
+    service, channel = sim_server
+    client = SimServiceClient(channel)
+
+    assert (await client.set_parameters(time_scale=2.0)).success
+    assert (await client.set_parameters()).success
+    assert (await client.set_parameters(gravity=None, initial_state={"qpos": [1.0, 2.0]})).success
+
+    first, empty, last = service.parameters
+    assert first.time_scale == 2.0 and not first.HasField("gravity") and not first.HasField("initial_state")
+    assert empty == sim_pb2.SimulationParameters()
+    assert not last.HasField("gravity") and list(last.initial_state.qpos) == [1.0, 2.0]
@@ -10,6 +10,7 @@ use std::collections::HashMap;
 use std::sync::Arc;
 use tokio::signal;
 use tokio::sync::Mutex;
+use tonic::codec::CompressionEncoding;
 use tonic::transport::Server;
 use tracing::{debug, error, info};
 use tracing_subscriber::filter::EnvFilter;
@@ -34,7 +35,13 @@ fn add_service_to_router(
 ) -> tonic::transport::server::Router {
     debug!("Adding service to router: {:?}", service);
     match service {
-        ServiceEnum::Actuator(svc) => router.add_service(svc),
+        // Polled actuator state responses grow with the number of actuators and
+        // compress well; gzip is only used when the client advertises support for
+        // it. Every other actuator response opts out in `services/actuator.rs`.
+        ServiceEnum::Actuator(svc) => router.add_service(
+            svc.accept_compressed(CompressionEncoding::Gzip)
+                .send_compressed(CompressionEncoding::Gzip),
+        ),
         ServiceEnum::Imu(svc) => router.add_service(svc),
         ServiceEnum::ProcessManager(svc) => router.add_service(svc),
         ServiceEnum::Inference(svc) => router.add_service(svc),
@@ -1,11 +1,15 @@
 use crate::grpc_interface::google::longrunning::Operation;
 use crate::hal::Actuator;
 use crate::kos_proto::actuator::actuator_service_server::ActuatorService;
-use crate::kos_proto::actuator::*;
-use crate::kos_proto::common::ActionResponse;
+use crate::kos_proto::actuator::{ActuatorCommand as ProtoActuatorCommand, *};
+use crate::kos_proto::common::{ActionResponse, ActionResult, Error as KosError, ErrorCode};
 use crate::telemetry::Telemetry;
 use crate::telemetry_types::{ActuatorCommand, ActuatorState};
+use futures::Stream;
+use std::pin::Pin;
 use std::sync::Arc;
+use std::time::Duration;
+use tokio::time::MissedTickBehavior;
 use tonic::{Request, Response, Status};
 use tracing::trace;
 
@@ -19,41 +23,141 @@ impl ActuatorServiceImpl {
     }
 }
 
+/// Wraps a response that should never be gzipped.
+///
+/// The actuator service compresses responses by default (see `daemon.rs`), which
+/// only pays off for polled `GetActuatorsState` replies. Every other response is
+/// small or latency-sensitive, so it opts out here.
+fn uncompressed<T>(message: T) -> Response<T> {
+    let mut response = Response::new(message);
+    response.disable_compression();
+    response
+}
+
+async fn handle_command_actuators(
+    actuator: &Arc<dyn Actuator>,
+    commands: Vec<ProtoActuatorCommand>,
+) -> Result<Vec<ActionResult>, Status> {
+    let telemetry_commands: Vec<_> = commands.iter().map(ActuatorCommand::from).collect();
+
+    let results = actuator
+        .command_actuators(commands)
+        .await
+        .map_err(|e| Status::internal(format!("Failed to command actuators, {:?}", e)))?;
+
+    trace!(
+        "Commanding actuators, request: {:?}, results: {:?}",
+        telemetry_commands.clone(),
+        results
+    );
+
+    let telemetry = Telemetry::get().await;
+    if let Some(telemetry) = telemetry {
+        telemetry.increment_inference_step();
+
+        if let Err(e) = telemetry
+            .publish("actuator/command", &telemetry_commands)
+            .await
+        {
+            tracing::warn!("Failed to publish telemetry: {}", e);
+        }
+    }
+
+    Ok(results)
+}
+
+async fn handle_get_actuators_state(
+    actuator: &Arc<dyn Actuator>,
+    actuator_ids: Vec<u32>,
+) -> Result<Vec<ActuatorStateResponse>, Status> {
+    let states = actuator
+        .get_actuators_state(actuator_ids.clone())
+        .await
+        .map_err(|e| Status::internal(format!("Failed to get actuators state, {:?}", e)))?;
+
+    let telemetry_states: Vec<_> = states.iter().map(ActuatorState::from).collect();
+    let telemetry = Telemetry::get().await;
+    if let Some(telemetry) = telemetry {
+        if let Err(e) = telemetry.publish("actuator/state", &telemetry_states).await {
+            tracing::warn!("Failed to publish telemetry: {}", e);
+        }
+    }
+
+    trace!(
+        "Getting actuators state, request: {:?}, response: {:?}",
+        actuator_ids,
+        states
+    );
+    Ok(states)
+}
+
+fn states_response(
+    states: Vec<ActuatorStateResponse>,
+    columnar: bool,
+) -> GetActuatorsStateResponse {
+    if !columnar {
+        return GetActuatorsStateResponse {
+            states,
+            ..Default::default()
+        };
+    }
+
+    GetActuatorsStateResponse {
+        states: vec![],
+        actuator_ids: states.iter().map(|s| s.actuator_id).collect(),
+        online: states.iter().map(|s| s.online).collect(),
+        positions: states
+            .iter()
+            .map(|s| s.position.unwrap_or(f64::NAN))
+            .collect(),
+        velocities: states
+            .iter()
+            .map(|s| s.velocity.unwrap_or(f64::NAN))
+            .collect(),
+        torques: states
+            .iter()
+            .map(|s| s.torque.unwrap_or(f64::NAN))
+            .collect(),
+    }
+}
+
 #[tonic::async_trait]
 impl ActuatorService for ActuatorServiceImpl {
     async fn command_actuators(
         &self,
         request: Request<CommandActuatorsRequest>,
     ) -> Result<Response<CommandActuatorsResponse>, Status> {
-        let commands = request.into_inner().commands;
+        let request = request.into_inner();
+        let results = handle_command_actuators(&self.actuator, request.commands).await?;
+        Ok(uncompressed(CommandActuatorsResponse {
+            results,
+            sequence_id: request.sequence_id,
+        }))
+    }
 
-        let telemetry_commands: Vec<_> = commands.iter().map(ActuatorCommand::from).collect();
+    type CommandActuatorsStreamStream =
+        Pin<Box<dyn Stream<Item = Result<CommandActuatorsResponse, Status>> + Send>>;
 
-        let results = self
-            .actuator
-            .command_actuators(commands)
-            .await
-            .map_err(|e| Status::internal(format!("Failed to command actuators, {:?}", e)))?;
-
-        trace!(
-            "Commanding actuators, request: {:?}, results: {:?}",
-            telemetry_commands.clone(),
-            results
-        );
-
-        let telemetry = Telemetry::get().await;
-        if let Some(telemetry) = telemetry {
-            telemetry.increment_inference_step();
-
-            if let Err(e) = telemetry
-                .publish("actuator/command", &telemetry_commands)
-                .await
-            {
-                tracing::warn!("Failed to publish telemetry: {}", e);
+    async fn command_actuators_stream(
+        &self,
+        request: Request<tonic::Streaming<CommandActuatorsRequest>>,
+    ) -> Result<Response<Self::CommandActuatorsStreamStream>, Status> {
+        let mut stream = request.into_inner();
+        let actuator = self.actuator.clone();
+
+        let response_stream = async_stream::try_stream! {
+            while let Some(request) = stream.message().await? {
+                let results = handle_command_actuators(&actuator, request.commands).await?;
+                yield CommandActuatorsResponse {
+                    results,
+                    sequence_id: request.sequence_id,
+                };
             }
-        }
+        };
 
-        Ok(Response::new(CommandActuatorsResponse { results }))
+        Ok(uncompressed(
+            Box::pin(response_stream) as Self::CommandActuatorsStreamStream
+        ))
     }
 
     async fn configure_actuator(
@@ -66,7 +170,36 @@ impl ActuatorService for ActuatorServiceImpl {
             .configure_actuator(config)
             .await
             .map_err(|e| Status::internal(format!("Failed to configure actuator, {:?}", e)))?;
-        Ok(Response::new(response))
+        Ok(uncompressed(response))
+    }
+
+    async fn configure_actuators(
+        &self,
+        request: Request<ConfigureActuatorsRequest>,
+    ) -> Result<Response<ConfigureActuatorsResponse>, Status> {
+        let configs = request.into_inner().configs;
+        let mut results = Vec::with_capacity(configs.len());
+        for config in configs {
+            let actuator_id = config.actuator_id;
+            let result = match self.actuator.configure_actuator(config).await {
+                Ok(response) => ActionResult {
+                    actuator_id,
+                    success: response.success,
+                    error: response.error,
+                },
+                Err(e) => ActionResult {
+                    actuator_id,
+                    success: false,
+                    error: Some(KosError {
+                        code: ErrorCode::HardwareFailure as i32,
+                        message: format!("Failed to configure actuator, {:?}", e),
+                    }),
+                },
+            };
+            results.push(result);
+        }
+        trace!("Configuring actuators, results: {:?}", results);
+        Ok(uncompressed(ConfigureActuatorsResponse { results }))
     }
 
     async fn calibrate_actuator(
@@ -80,7 +213,7 @@ impl ActuatorService for ActuatorServiceImpl {
             .await
             .map_err(|e| Status::internal(format!("Failed to calibrate actuator, {:?}", e)))?;
 
-        Ok(Response::new(operation))
+        Ok(uncompressed(operation))
     }
 
     async fn get_actuators_state(
@@ -88,26 +221,39 @@ impl ActuatorService for ActuatorServiceImpl {
         request: Request<GetActuatorsStateRequest>,
     ) -> Result<Response<GetActuatorsStateResponse>, Status> {
         let request = request.into_inner();
-        let actuator_ids = request.actuator_ids.clone();
-        let states = self
-            .actuator
-            .get_actuators_state(actuator_ids)
-            .await
-            .map_err(|e| Status::internal(format!("Failed to get actuators state, {:?}", e)))?;
+        let states = handle_get_actuators_state(&self.actuator, request.actuator_ids).await?;
+        Ok(Response::new(states_response(states, request.columnar)))
+    }
 
-        let telemetry_states: Vec<_> = states.iter().map(ActuatorState::from).collect();
-        let telemetry = Telemetry::get().await;
-        if let Some(telemetry) = telemetry {
-            if let Err(e) = telemetry.publish("actuator/state", &telemetry_states).await {
-                tracing::warn!("Failed to publish telemetry: {}", e);
+    type StreamActuatorsStateStream =
+        Pin<Box<dyn Stream<Item = Result<GetActuatorsStateResponse, Status>> + Send>>;
+
+    async fn stream_actuators_state(
+        &self,
+        request: Request<StreamActuatorsStateRequest>,
+    ) -> Result<Response<Self::StreamActuatorsStateStream>, Status> {
+        let request = request.into_inner();
+        let period = Duration::try_from_secs_f64(1.0 / request.frequency)
+            .ok()
+            .filter(|period| !period.is_zero())
+            .ok_or_else(|| Status::invalid_argument("Frequency must be positive and finite"))?;
+        let actuator = self.actuator.clone();
+
+        let response_stream = async_stream::try_stream! {
+            let mut interval = tokio::time::interval(period);
+            interval.set_missed_tick_behavior(MissedTickBehavior::Skip);
+            loop {
+                interval.tick().await;
+                let states =
+                    handle_get_actuators_state(&actuator, request.actuator_ids.clone()).await?;
+                yield states_response(states, request.columnar);
             }
-        }
+        };
 
-        trace!(
-            "Getting actuators state, request: {:?}, response: {:?}",
-            request.clone(),
-            states
-        );
-        Ok(Response::new(GetActuatorsStateResponse { states }))
+        // Streamed samples are sent at the client's rate, so gzip would add
+        // CPU time and latency to every frame of the preferred telemetry path.
+        Ok(uncompressed(
+            Box::pin(response_stream) as Self::StreamActuatorsStateStream
+        ))
     }
 }